@@ -8,81 +8,146 @@ in Demo Mode with synthesised data.
 
 from __future__ import annotations
 
+import importlib.util
 import math
 import sys
+import threading
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
+import numpy as np
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 
 try:
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg  # type: ignore
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 except Exception:  # pragma: no cover - optional deps missing
-    plt = None  # type: ignore
-
-try:
-    from pyx2cscope.x2cscope import X2CScope  # type: ignore
-except Exception:  # pragma: no cover - missing dependency
-    X2CScope = None
+    Figure = None  # type: ignore
+    FigureCanvasTkAgg = None  # type: ignore
 
 import serial.tools.list_ports
 
 
+# pyX2Cscope is imported on first connect; see _load_x2c().
+_X2CScope = None
+_has_x2c: Optional[bool] = None
+
+
+def _load_x2c() -> Optional[type]:
+    """Import pyX2Cscope once and return ``X2CScope`` (``None`` if missing)."""
+    global _X2CScope, _has_x2c
+    if _has_x2c is None:
+        try:
+            from pyx2cscope.x2cscope import X2CScope  # type: ignore
+        except Exception:  # pragma: no cover - missing dependency
+            X2CScope = None
+        _X2CScope = X2CScope
+        _has_x2c = X2CScope is not None
+    return _X2CScope
+
+
+def _x2c_missing() -> bool:
+    """Whether pyX2Cscope is unavailable, without importing it early."""
+    if _has_x2c is None:
+        return importlib.util.find_spec("pyx2cscope") is None
+    return not _has_x2c
+
+
+# Conversion factors used on every GUI tick.
+_TWO_PI = 2.0 * math.pi
+_INV_PI = 1.0 / math.pi
+_INV_2PI = 1.0 / _TWO_PI
+_RAD2DEG = 180.0 / math.pi
+_RAD_S_TO_RPM = 60.0 * _INV_2PI
+
+
+def _kinematics(ang: float, prev: float, turns: float, rpm_scale: float) -> tuple[float, float, float]:
+    """Return updated turn count, speed in RPM and angle/π for a new sample."""
+    delta = ang - prev
+    delta -= _TWO_PI * math.floor(delta * _INV_2PI + 0.5)  # wrap to [-π, π)
+    return turns + delta * _INV_2PI, delta * rpm_scale, ang * _INV_PI
+
+
+# numba (optional) is imported on first connect; see _load_kinematics().
+_kinematics_impl = None
+
+
+def _load_kinematics() -> Callable[[float, float, float, float], tuple[float, float, float]]:
+    """Return ``_kinematics``, JIT-compiled with numba when it is installed."""
+    global _kinematics_impl
+    if _kinematics_impl is None:
+        try:
+            from numba import njit  # type: ignore
+        except Exception:  # pragma: no cover - numba missing
+            _kinematics_impl = _kinematics
+        else:
+            _kinematics_impl = njit(cache=True, fastmath=True)(_kinematics)
+    return _kinematics_impl
+
+
 @dataclass
 class _DemoSource:
     """Fallback data source when pyX2Cscope isn't available."""
 
     freq: float = 1.0  # Hz
+    tick: float = 0.020  # s between table entries
 
     def __post_init__(self) -> None:
-        self.t_last = time.perf_counter()
-        self.angle = 0.0
+        # One full period of (sin, cos, angle) sampled every ``tick``; read()
+        # just picks the entry for the current elapsed tick count.
+        n = max(1, int(round(1.0 / (self.freq * self.tick))))
+        phases = np.linspace(0.0, 2 * math.pi, n, endpoint=False)
+        self._sin_tab = np.sin(phases).tolist()
+        self._cos_tab = np.cos(phases).tolist()
+        self._ang_tab = (((phases + math.pi) % (2 * math.pi)) - math.pi).tolist()
+        self._n = n
+        self._tick_ns = int(self.tick * 1e9)
+        self.t0_ns = time.perf_counter_ns()
 
     def read(self) -> tuple[float, float, float]:
-        now = time.perf_counter()
-        dt = now - self.t_last
-        self.t_last = now
-        self.angle += 2 * math.pi * self.freq * dt
-        s = math.sin(self.angle)
-        c = math.cos(self.angle)
-        ang = ((self.angle + math.pi) % (2 * math.pi)) - math.pi
-        return s, c, ang
+        i = (time.perf_counter_ns() - self.t0_ns) // self._tick_ns % self._n
+        return self._sin_tab[i], self._cos_tab[i], self._ang_tab[i]
 
 
 class _ScopeWrapper:
     """Tiny wrapper around pyX2Cscope with demo fallback."""
 
+    VARS = ("sin_calibrated", "cos_calibrated", "resolver_position")
+
     def __init__(self) -> None:
-        self.demo = X2CScope is None
+        self.demo = _x2c_missing()
         self.scope = None
         self.sin = None
         self.cos = None
         self.ang = None
         self.demo_src = _DemoSource()
+        # Bound to the matching reader on connect/disconnect so the per-tick
+        # call doesn't re-check the mode.
+        self.read: Callable[[], tuple[float, float, float]] = self.demo_src.read
 
     def connect(self, port: str, elf: str) -> None:
+        X2CScope = _load_x2c()
         if X2CScope is None:
             self.demo = True
             return
         self.scope = X2CScope(port=port)
         self.scope.import_variables(elf)
-        self.sin = self.scope.get_variable("sin_calibrated")
-        self.cos = self.scope.get_variable("cos_calibrated")
-        self.ang = self.scope.get_variable("resolver_position")
+        self.sin = self.scope.get_variable(self.VARS[0])
+        self.cos = self.scope.get_variable(self.VARS[1])
+        self.ang = self.scope.get_variable(self.VARS[2])
         self.demo = False
+        self.read = self._read_vars
 
     def disconnect(self) -> None:
         if self.scope is not None:
             self.scope.disconnect()
         self.scope = None
-        self.demo = X2CScope is None
+        self.demo = _x2c_missing()
+        self.read = self.demo_src.read
 
-    def read(self) -> tuple[float, float, float]:
-        if self.demo or self.scope is None:
-            return self.demo_src.read()
+    def _read_vars(self) -> tuple[float, float, float]:
         return (
             float(self.sin.get_value()),  # type: ignore[call-arg]
             float(self.cos.get_value()),  # type: ignore[call-arg]
@@ -92,9 +157,11 @@ class _ScopeWrapper:
 
 class InductiveSensorDemoTk:
     DT_MS = 20
+    DEMO_DT_MS = 33  # ~30 fps is plenty for synthesised data
+    HISTORY = 1000  # samples kept per trace
 
     def __init__(self) -> None:
-        if plt is None:
+        if Figure is None or FigureCanvasTkAgg is None:
             raise RuntimeError("matplotlib is required for the Tkinter demo")
 
         self.root = tk.Tk()
@@ -103,9 +170,20 @@ class InductiveSensorDemoTk:
         self._scope = _ScopeWrapper()
         self.connected = False
 
-        self.t0 = time.perf_counter()
+        self.t0_ns = time.perf_counter_ns()
         self.prev_ang: Optional[float] = None
+        self.prev_t = 0.0
         self.turns = 0.0
+        self._kinematics = _kinematics  # replaced by the JIT version on connect
+
+        # Serial reads run on a worker thread which publishes the newest
+        # (t, sin, cos, angle) sample; rebinding a tuple is atomic under the
+        # GIL so the Tk thread can pick it up without locking. Each reader
+        # gets its own stop event so a stale thread can never be revived.
+        self._latest: Optional[tuple[float, float, float, float]] = None
+        self._shown: Optional[tuple[float, float, float, float]] = None
+        self._stop = threading.Event()
+        self._reader: Optional[threading.Thread] = None
 
         self._build_ui()
         self._after_id: Optional[str] = None
@@ -125,25 +203,44 @@ class InductiveSensorDemoTk:
 
         ttk.Label(conn, text="COM port:").grid(row=1, column=0, sticky="e", pady=(4,0))
         self.port_var = tk.StringVar()
-        self.port_menu = ttk.OptionMenu(conn, self.port_var, "-", *self._ports())
+        self._port_cache = self._ports()
+        self.port_menu = ttk.OptionMenu(conn, self.port_var, "-", *self._port_cache)
         self.port_menu.grid(row=1, column=1, sticky="we", padx=4, pady=(4,0))
         ttk.Button(conn, text="↻", width=3, command=self._refresh_ports).grid(row=1, column=2, pady=(4,0))
 
         self.conn_btn = ttk.Button(conn, text="Connect", command=self._toggle_conn)
         self.conn_btn.grid(row=2, column=0, columnspan=3, pady=(6, 0))
 
-        fig, ax = plt.subplots()
-        fig.set_facecolor("white")
+        fig = Figure(facecolor="white")
+        ax = fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(fig, master=main)
         self.canvas.get_tk_widget().pack(fill="both", expand=True, pady=8)
         ax.set_xlabel("Time (s)")
         ax.set_ylabel("Value")
         ax.grid(True)
         self._ax = ax
-        (self.line_sin,) = ax.plot([], [], label="Sine", color="b")
-        (self.line_cos,) = ax.plot([], [], label="Cosine", color="g")
-        (self.line_ang,) = ax.plot([], [], label="Angle/π", color="hotpink")
-        ax.legend()
+        (self.line_sin,) = ax.plot([], [], label="Sine", color="b", animated=True)
+        (self.line_cos,) = ax.plot([], [], label="Cosine", color="g", animated=True)
+        (self.line_ang,) = ax.plot([], [], label="Angle/π", color="hotpink", animated=True)
+        # The legend sits above the traces, so it is redrawn after them.
+        self._legend = ax.legend()
+        self._legend.set_animated(True)
+
+        # Axis limits are managed by hand: the x window scrolls by half its
+        # width once the newest sample reaches the right edge, and the y range
+        # only grows when a sample falls outside it.
+        self._window = self.HISTORY * self.DT_MS / 1000.0
+        self._xlim = (0.0, self._window)
+        self._ylim = (-1.1, 1.1)
+        ax.set_xlim(*self._xlim)
+        ax.set_ylim(*self._ylim)
+
+        # Blitting: every full draw (first show, resize, axis change)
+        # recaptures the static background; per-frame updates only repaint
+        # the lines.
+        self._bg = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.draw()
 
         info = ttk.Frame(main)
         info.pack(fill="x")
@@ -152,24 +249,67 @@ class InductiveSensorDemoTk:
         self.lbl_turns = ttk.Label(info, text="Turns: —")
         for w in (self.lbl_angle, self.lbl_speed, self.lbl_turns):
             w.pack(side="left", padx=6)
+        self._last_deg: Optional[float] = None
+        self._last_rpm: Optional[float] = None
+        self._last_turns: Optional[float] = None
         info.pack_propagate(False)
 
-        self.data_t: list[float] = []
-        self.data_sin: list[float] = []
-        self.data_cos: list[float] = []
-        self.data_ang: list[float] = []
+        # Ring buffer of (t, sin, cos, angle/π) rows, one column per sample.
+        self._buf = np.empty((4, self.HISTORY), dtype=np.float64)
+        self._idx = 0
+        self._fill = 0
+
+    # ------------------------------------------------------------- plotting --
+    def _draw_lines(self) -> None:
+        for artist in (self.line_sin, self.line_cos, self.line_ang, self._legend):
+            self._ax.draw_artist(artist)
+
+    def _on_draw(self, _event) -> None:
+        self._bg = self.canvas.copy_from_bbox(self._ax.bbox)
+        self._draw_lines()
+
+    def _history(self) -> np.ndarray:
+        """Return the buffered samples in chronological order."""
+        if self._fill < self.HISTORY:
+            return self._buf[:, : self._fill]
+        if self._idx == 0:
+            return self._buf
+        return np.concatenate((self._buf[:, self._idx :], self._buf[:, : self._idx]), axis=1)
+
+    def _blit(self) -> None:
+        self.canvas.restore_region(self._bg)
+        self._draw_lines()
+        # FigureCanvasTkAgg.blit copies just this bbox from the Agg buffer
+        # straight into the Tk PhotoImage; no intermediate image is needed.
+        self.canvas.blit(self._ax.bbox)
 
     # ------------------------------------------------------------- utilities --
     @staticmethod
-    def _ports() -> list[str]:
-        return [p.device for p in serial.tools.list_ports.comports()] or ["-"]
+    def _ports() -> tuple[str, ...]:
+        return tuple(p.device for p in serial.tools.list_ports.comports()) or ("-",)
 
     def _refresh_ports(self) -> None:
+        # Port enumeration can take a while (WMI on Windows); scan in the
+        # background and hand the result back to the Tk thread.
+        threading.Thread(target=self._scan_ports, daemon=True).start()
+
+    def _scan_ports(self) -> None:
+        ports = self._ports()
+        try:
+            self.root.after(0, self._set_ports, ports)
+        except (RuntimeError, tk.TclError):  # window closed meanwhile
+            pass
+
+    def _set_ports(self, ports: tuple[str, ...]) -> None:
+        if ports == self._port_cache:
+            return
+        self._port_cache = ports
         menu = self.port_menu["menu"]
         menu.delete(0, "end")
-        for p in self._ports():
+        for p in ports:
             menu.add_command(label=p, command=lambda v=p: self.port_var.set(v))
-        self.port_var.set("-")
+        if self.port_var.get() not in ports:
+            self.port_var.set("-")
 
     def _browse(self) -> None:
         fn = filedialog.askopenfilename(title="Select ELF", filetypes=[("ELF", "*.elf"), ("All", "*.*")])
@@ -194,65 +334,152 @@ class InductiveSensorDemoTk:
         except Exception as e:  # pragma: no cover - hardware errors
             messagebox.showerror("Connect", str(e))
             return
+        self._kinematics = _load_kinematics()
+        self._kinematics(0.0, 0.0, 0.0, 1.0)  # pay any JIT compile cost up front
         self.connected = True
         self.conn_btn.config(text="Disconnect")
-        self.t0 = time.perf_counter()
+        self.t0_ns = time.perf_counter_ns()
         self.prev_ang = None
         self.turns = 0.0
-        self.data_t.clear()
-        self.data_sin.clear()
-        self.data_cos.clear()
-        self.data_ang.clear()
+        self._idx = 0
+        self._fill = 0
+        self._xlim = (0.0, self._window)
+        self._ylim = (-1.1, 1.1)
+        self._ax.set_xlim(*self._xlim)
+        self._ax.set_ylim(*self._ylim)
+        self._bg = None  # force a full redraw with the reset axes
+        self._latest = None
+        self._shown = None
+        self._stop = threading.Event()
+        self._reader = threading.Thread(target=self._reader_loop, args=(self._stop,), daemon=True)
+        self._reader.start()
         self._schedule_update()
 
     def _disconnect(self) -> None:
         if self._after_id is not None:
             self.root.after_cancel(self._after_id)
             self._after_id = None
-        self._scope.disconnect()
+        self._stop.set()
         self.connected = False
-        self.conn_btn.config(text="Connect")
+        # Keep the button disabled until the reader is gone so a reconnect
+        # can't start a second reader or reopen the port under the old one.
+        self.conn_btn.config(text="Connect", state="disabled")
+        self._finish_disconnect()
+
+    def _finish_disconnect(self) -> None:
+        # The reader may be inside a serial read; only close the scope once
+        # it has actually exited.
+        if self._reader is not None and self._reader.is_alive():
+            self.root.after(10, self._finish_disconnect)
+            return
+        self._reader = None
+        self._scope.disconnect()
+        self.conn_btn.config(state="normal")
+
+    def _reader_failed(self, exc: Exception) -> None:
+        if not self.connected:
+            return
+        self._disconnect()
+        messagebox.showerror("Read", str(exc))
 
     # --------------------------------------------------------------- update ---
+    def _period_ms(self) -> int:
+        """Interval at which the reader polls the scope and Tk redraws."""
+        # Demo data is free, so ~30 fps is enough. With hardware every read
+        # returns a fresh sample; a link slower than DT_MS simply makes the
+        # reader's wait drop to zero.
+        return self.DEMO_DT_MS if self._scope.demo else self.DT_MS
+
     def _schedule_update(self) -> None:
-        self._after_id = self.root.after(self.DT_MS, self._update)
+        self._after_id = self.root.after(self._period_ms(), self._update)
+
+    def _reader_loop(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            start_ns = time.perf_counter_ns()
+            try:
+                vals = self._scope.read()
+            except Exception as e:  # pragma: no cover - hardware errors
+                if not stop.is_set():
+                    try:
+                        self.root.after(0, self._reader_failed, e)
+                    except (RuntimeError, tk.TclError):  # window closed meanwhile
+                        pass
+                return
+            now_ns = time.perf_counter_ns()
+            self._latest = ((now_ns - self.t0_ns) * 1e-9, *vals)
+            # One read per interval; the read itself counts toward it.
+            stop.wait(max(0.0, self._period_ms() * 1e-3 - (now_ns - start_ns) * 1e-9))
 
     def _update(self) -> None:
-        s, c, ang = self._scope.read()
-        now = time.perf_counter() - self.t0
+        sample = self._latest
+        if sample is None or sample is self._shown:
+            if self.connected:
+                self._schedule_update()
+            return
+        self._shown = sample
+        now, s, c, ang = sample
 
-        if self.prev_ang is None:
+        dt = now - self.prev_t
+        if not math.isfinite(ang):
+            # Bad reading: plot it, but keep it out of the turn/speed state
+            # so the next good sample unwraps against the last good one.
             rpm = 0.0
+            ang_pi = ang * _INV_PI
         else:
-            delta = ang - self.prev_ang
-            if delta > math.pi:
-                delta -= 2 * math.pi
-            elif delta < -math.pi:
-                delta += 2 * math.pi
-            self.turns += delta / (2 * math.pi)
-            rpm = delta / (self.DT_MS / 1000.0) * 60 / (2 * math.pi)
-        self.prev_ang = ang
-
-        self.data_t.append(now)
-        self.data_sin.append(s)
-        self.data_cos.append(c)
-        self.data_ang.append(ang / math.pi)
-        if len(self.data_t) > 1000:
-            self.data_t.pop(0)
-            self.data_sin.pop(0)
-            self.data_cos.pop(0)
-            self.data_ang.pop(0)
-
-        self.line_sin.set_data(self.data_t, self.data_sin)
-        self.line_cos.set_data(self.data_t, self.data_cos)
-        self.line_ang.set_data(self.data_t, self.data_ang)
-        self._ax.relim()
-        self._ax.autoscale_view()
-        self.canvas.draw()
-
-        self.lbl_angle.config(text=f"Angle: {math.degrees(ang):.1f}°")
-        self.lbl_speed.config(text=f"Speed: {rpm:.1f} RPM")
-        self.lbl_turns.config(text=f"Turns: {self.turns:.2f}")
+            if self.prev_ang is None or dt <= 0.0:
+                rpm = 0.0
+                ang_pi = ang * _INV_PI
+            else:
+                # Frame spacing varies, so scale by the real time between samples.
+                self.turns, rpm, ang_pi = self._kinematics(ang, self.prev_ang, self.turns, _RAD_S_TO_RPM / dt)
+            self.prev_ang = ang
+            self.prev_t = now
+
+        self._buf[:, self._idx] = (now, s, c, ang_pi)
+        self._idx = (self._idx + 1) % self.HISTORY
+        if self._fill < self.HISTORY:
+            self._fill += 1
+
+        t, y_sin, y_cos, y_ang = self._history()
+        self.line_sin.set_data(t, y_sin)
+        self.line_cos.set_data(t, y_cos)
+        self.line_ang.set_data(t, y_ang)
+        redraw = self._bg is None
+        if now > self._xlim[1]:
+            half = self._window / 2
+            self._xlim = (now - half, now + half)
+            self._ax.set_xlim(*self._xlim)
+            redraw = True
+        # Only finite values can widen the range; set_ylim rejects NaN/inf.
+        finite = [v for v in (s, c, ang_pi) if math.isfinite(v)]
+        if finite:
+            lo, hi = self._ylim
+            y_min = min(finite)
+            y_max = max(finite)
+            if y_min < lo or y_max > hi:
+                new_lim = (min(lo, y_min * 1.1), max(hi, y_max * 1.1))
+                if all(map(math.isfinite, new_lim)):  # * 1.1 can overflow
+                    self._ylim = new_lim
+                    self._ax.set_ylim(*self._ylim)
+                    redraw = True
+        if redraw:
+            self.canvas.draw()  # _on_draw recaptures the background
+        else:
+            self._blit()
+
+        # Only touch the labels when the displayed text would change.
+        deg = round(ang * _RAD2DEG, 1)
+        if deg != self._last_deg:
+            self.lbl_angle.config(text=f"Angle: {deg:.1f}°")
+            self._last_deg = deg
+        rpm = round(rpm, 1)
+        if rpm != self._last_rpm:
+            self.lbl_speed.config(text=f"Speed: {rpm:.1f} RPM")
+            self._last_rpm = rpm
+        turns = round(self.turns, 2)
+        if turns != self._last_turns:
+            self.lbl_turns.config(text=f"Turns: {turns:.2f}")
+            self._last_turns = turns
 
         if self.connected:
             self._schedule_update()
@@ -12,22 +12,44 @@ available so the GUI can run without hardware.
 
 from __future__ import annotations
 
+import importlib.util
 import math
+import threading
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
-try:  # optional dependency
-    from pyx2cscope.x2cscope import X2CScope  # type: ignore
-except Exception:  # pragma: no cover - pyX2Cscope missing
-    X2CScope = None  # type: ignore
-
 import serial.tools.list_ports
 
 
+# pyX2Cscope is imported on first connect; see _load_x2c().
+_X2CScope = None
+_has_x2c: Optional[bool] = None
+
+
+def _load_x2c() -> Optional[type]:
+    """Import pyX2Cscope once and return ``X2CScope`` (``None`` if missing)."""
+    global _X2CScope, _has_x2c
+    if _has_x2c is None:
+        try:
+            from pyx2cscope.x2cscope import X2CScope  # type: ignore
+        except Exception:  # pragma: no cover - pyX2Cscope missing
+            X2CScope = None
+        _X2CScope = X2CScope
+        _has_x2c = X2CScope is not None
+    return _X2CScope
+
+
+def _x2c_missing() -> bool:
+    """Whether pyX2Cscope is unavailable, without importing it early."""
+    if _has_x2c is None:
+        return importlib.util.find_spec("pyx2cscope") is None
+    return not _has_x2c
+
+
 # ---------------------------------------------------------------------------
 # Demo backend
 # ---------------------------------------------------------------------------
@@ -56,13 +78,17 @@ class _ScopeWrapper:
     """Tiny wrapper around pyX2Cscope with demo fallback."""
 
     def __init__(self) -> None:
-        self.demo = X2CScope is None
-        self.scope: Optional[X2CScope] = None
+        self.demo = _x2c_missing()
+        self.scope = None
         self.var_temp = None
         self.var_rate = None
         self.demo_src = _DemoSource()
+        # Bound to the matching reader on connect/disconnect so the per-tick
+        # call doesn't re-check the mode.
+        self.read: Callable[[], tuple[float, int]] = self.demo_src.read
 
     def connect(self, port: str, elf: str) -> None:
+        X2CScope = _load_x2c()
         if X2CScope is None:
             self.demo = True
             return
@@ -71,16 +97,16 @@ class _ScopeWrapper:
         self.var_temp = self.scope.get_variable("TemperatureValueX2C")
         self.var_rate = self.scope.get_variable("tempSampleRate")
         self.demo = False
+        self.read = self._read_scope
 
     def disconnect(self) -> None:
         if self.scope is not None:
             self.scope.disconnect()
         self.scope = None
-        self.demo = X2CScope is None
+        self.demo = _x2c_missing()
+        self.read = self.demo_src.read
 
-    def read(self) -> tuple[float, int]:
-        if self.demo or self.scope is None:
-            return self.demo_src.read()
+    def _read_scope(self) -> tuple[float, int]:
         return (
             float(self.var_temp.get_value()),  # type: ignore[call-arg]
             int(self.var_rate.get_value()),  # type: ignore[call-arg]
@@ -98,6 +124,14 @@ RATE_LABELS = {
     3: "4 s",
 }
 
+# Sensor sampling period in ms for each ``tempSampleRate`` value.
+RATE_PERIOD_MS = {
+    0: 500,
+    1: 1000,
+    2: 2000,
+    3: 4000,
+}
+
 
 class TemperatureGUI:
     DT_MS = 200
@@ -109,6 +143,9 @@ class TemperatureGUI:
         self._scope = _ScopeWrapper()
         self.connected = False
         self._after_id: Optional[str] = None
+        self._next_dt_ms = self.DT_MS
+        self._last_temp_str: Optional[str] = None
+        self._last_rate: Optional[int] = None
 
         self._build_ui()
 
@@ -127,7 +164,8 @@ class TemperatureGUI:
 
         ttk.Label(conn, text="Port:").grid(row=1, column=0, sticky="e")
         self.port_var = tk.StringVar(value="-")
-        self.port_menu = ttk.OptionMenu(conn, self.port_var, "-", *self._ports())
+        self._port_cache = self._ports()
+        self.port_menu = ttk.OptionMenu(conn, self.port_var, "-", *self._port_cache)
         self.port_menu.grid(row=1, column=1, sticky="we", padx=4)
         ttk.Button(conn, text="Refresh", command=self._refresh_ports).grid(row=1, column=2)
 
@@ -145,25 +183,45 @@ class TemperatureGUI:
 
         self.canvas = tk.Canvas(disp, width=60, height=200, bg="white")
         self.canvas.pack(pady=8)
+        self._therm_outline = self.canvas.create_rectangle(20, 10, 40, 190, outline="black", width=2)
+        self._therm_fill = self.canvas.create_rectangle(20, 190, 40, 190, fill="red", outline="")
+        self._last_therm_h = -1
         self._draw_thermometer(0.0)
 
     def _draw_thermometer(self, temp: float) -> None:
-        self.canvas.delete("all")
-        self.canvas.create_rectangle(20, 10, 40, 190, outline="black", width=2)
-        h = max(0.0, min(temp, 125.0)) / 125.0 * 180.0
-        self.canvas.create_rectangle(20, 190 - h, 40, 190, fill="red", outline="")
+        h = int(max(0.0, min(temp, 125.0)) * (180.0 / 125.0))
+        if h == self._last_therm_h:  # bar wouldn't move by a whole pixel
+            return
+        self.canvas.coords(self._therm_fill, 20, 190 - h, 40, 190)
+        self._last_therm_h = h
 
     # ------------------------------------------------------------- utilities --
     @staticmethod
-    def _ports() -> list[str]:
-        return [p.device for p in serial.tools.list_ports.comports()] or ["-"]
+    def _ports() -> tuple[str, ...]:
+        return tuple(p.device for p in serial.tools.list_ports.comports()) or ("-",)
 
     def _refresh_ports(self) -> None:
+        # Port enumeration can take a while (WMI on Windows); scan in the
+        # background and hand the result back to the Tk thread.
+        threading.Thread(target=self._scan_ports, daemon=True).start()
+
+    def _scan_ports(self) -> None:
+        ports = self._ports()
+        try:
+            self.root.after(0, self._set_ports, ports)
+        except (RuntimeError, tk.TclError):  # window closed meanwhile
+            pass
+
+    def _set_ports(self, ports: tuple[str, ...]) -> None:
+        if ports == self._port_cache:
+            return
+        self._port_cache = ports
         menu = self.port_menu["menu"]
         menu.delete(0, "end")
-        for p in self._ports():
+        for p in ports:
             menu.add_command(label=p, command=lambda v=p: self.port_var.set(v))
-        self.port_var.set("-")
+        if self.port_var.get() not in ports:
+            self.port_var.set("-")
 
     def _browse(self) -> None:
         fn = filedialog.askopenfilename(title="Select ELF", filetypes=[("ELF", "*.elf"), ("All", "*.*")])
@@ -190,6 +248,7 @@ class TemperatureGUI:
             return
         self.connected = True
         self.conn_btn.config(text="Disconnect")
+        self._next_dt_ms = self.DT_MS
         self._schedule_update()
 
     def _disconnect(self) -> None:
@@ -202,13 +261,25 @@ class TemperatureGUI:
 
     # --------------------------------------------------------------- update ---
     def _schedule_update(self) -> None:
-        self._after_id = self.root.after(self.DT_MS, self._update)
+        self._after_id = self.root.after(self._next_dt_ms, self._update)
 
     def _update(self) -> None:
         temp_c, rate = self._scope.read()
+        # Polling faster than the sensor samples only re-reads the same
+        # value; poll at twice the configured sample rate instead.
+        period = RATE_PERIOD_MS.get(rate)
+        self._next_dt_ms = period // 2 if period is not None else self.DT_MS
         temp_f = temp_c * 9.0 / 5.0 + 32.0
-        self.temp_str.set(f"Temperature: {temp_f:.0f} °F")
-        self.rate_str.set(f"Sample rate: {RATE_LABELS.get(rate, rate)}")
+        # Only touch the labels when the displayed text would change.
+        # Compare the formatted text: it is what the user sees, and unlike
+        # round() it copes with NaN/inf readings.
+        temp_txt = f"Temperature: {temp_f:.0f} °F"
+        if temp_txt != self._last_temp_str:
+            self.temp_str.set(temp_txt)
+            self._last_temp_str = temp_txt
+        if rate != self._last_rate:
+            self.rate_str.set(f"Sample rate: {RATE_LABELS.get(rate, rate)}")
+            self._last_rate = rate
         self._draw_thermometer(temp_c)
         if self.connected:
             self._schedule_update()